@@ -0,0 +1,196 @@
+# benchmarks/startup.py
+"""Cold-start benchmark: import time and time-to-first-response per route.
+
+Every sample runs in a fresh interpreter, as on a Vercel cold start or a
+gunicorn reload. Times are recorded as multiples of a bare interpreter start
+measured in the same run, so the baseline carries across machines. Medians
+are compared against startup_baseline.json and the script exits non-zero on
+a regression or when a lazily loaded module is imported eagerly by app.py.
+
+    python benchmarks/startup.py              # check against the baseline
+    python benchmarks/startup.py --update     # record a new baseline
+    python benchmarks/startup.py --profile    # slowest imports (-X importtime)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(ROOT, "benchmarks", "startup_baseline.json")
+
+# Must not be imported by `import app`; they load on the routes that need them
+LAZY_MODULES = [
+    "requests", "cachetools", "schedules", "bundle", "duas",
+    "regions.solar", "regions.bangladesh", "regions.united_kingdom", "regions.united_states"
+]
+
+ROUTES = [
+    "/",
+    "/district/dhaka",
+    "/api/health",
+    "/api/regions",
+    "/api/regions/bd",
+    "/api/districts",
+    "/api/divisions",
+    "/api/duas",
+    "/api/duas/random",
+    "/api/ramadan/today/dhaka",
+    "/api/ramadan/calendar/dhaka",
+    "/api/ramadan/countdown/dhaka",
+    "/api/ramadan/search?q=dhaka",
+    "/api/ramadan/nearby",
+    "/api/ramadan/bundle/dhaka",
+    "/api/ramadan/bundle",
+    "/api/ramadan/changes",
+    "/api/ramadan/today/london?region=uk",
+    "/api/ramadan/today/new-york?region=us",
+]
+
+
+def child(route):
+    """Runs inside a fresh interpreter: import app, optionally serve one request"""
+    sys.path.insert(0, ROOT)
+    start = time.perf_counter()
+    import app
+    imported = time.perf_counter()
+    result = {
+        "import_ms": (imported - start) * 1000,
+        "eager": [name for name in LAZY_MODULES if name in sys.modules]
+    }
+    if route:
+        response = app.app.test_client().get(route)
+        result["first_response_ms"] = (time.perf_counter() - imported) * 1000
+        result["status"] = response.status_code
+    print(json.dumps(result))
+
+
+def run_child(route=None):
+    # Upstream calls are disabled so the numbers measure our code, not the network
+    env = dict(os.environ, RAMADAN_OFFLINE="1")
+    args = [sys.executable, os.path.abspath(__file__), "--child"]
+    if route:
+        args.append(route)
+    start = time.perf_counter()
+    output = subprocess.run(args, cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def interpreter_ms():
+    """Wall time of a bare interpreter start, i.e. the runtime's share"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(repeat):
+    results = {"interpreter_ms": statistics.median(interpreter_ms() for _ in range(repeat))}
+    samples = [run_child() for _ in range(repeat)]
+    results["import_ms"] = statistics.median(s["import_ms"] for s in samples)
+    results["process_ms"] = statistics.median(s["process_ms"] for s in samples)
+    results["eager"] = samples[0]["eager"]
+    results["routes"] = {}
+    for route in ROUTES:
+        samples = [run_child(route) for _ in range(repeat)]
+        results["routes"][route] = {
+            "first_response_ms": statistics.median(s["first_response_ms"] for s in samples),
+            "status": samples[0]["status"]
+        }
+    return results
+
+
+def check(results, baseline, tolerance, slack):
+    """Return a list of human-readable failures"""
+    failures = []
+    if results["eager"]:
+        failures.append(f"modules imported eagerly by app.py: {', '.join(results['eager'])}")
+
+    def compare(label, value_ms, reference):
+        # Both sides in interpreter starts, so machine speed cancels out
+        value = value_ms / results["interpreter_ms"]
+        if reference is not None and value > reference * (1 + tolerance) + slack:
+            failures.append(f"{label}: {value:.2f}x interpreter start ({value_ms:.1f} ms) > baseline {reference:.2f}x")
+
+    compare("import app", results["import_ms"], baseline.get("import_x"))
+    for route, data in results["routes"].items():
+        if data["status"] >= 500:
+            failures.append(f"{route}: HTTP {data['status']}")
+        compare(route, data["first_response_ms"], baseline.get("routes", {}).get(route, {}).get("first_response_x"))
+    return failures
+
+
+def report(results):
+    interpreter = results["interpreter_ms"]
+    print(f"interpreter start      {interpreter:8.1f} ms")
+    print(f"import app             {results['import_ms']:8.1f} ms  {results['import_ms'] / interpreter:5.2f}x")
+    print(f"cold process total     {results['process_ms']:8.1f} ms  {results['process_ms'] / interpreter:5.2f}x")
+    print("time to first response (after import):")
+    for route, data in results["routes"].items():
+        print(f"  {data['first_response_ms']:8.1f} ms  {data['first_response_ms'] / interpreter:5.2f}x  {data['status']}  {route}")
+
+
+def profile(limit):
+    """Print the slowest cumulative imports of `import app`"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|").split("|")]
+        rows.append((int(cumulative_us), int(self_us), name))
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:limit]:
+        print(f"{cumulative_us / 1000:9.1f} ms {self_us / 1000:7.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--child", nargs="?", const="", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--slack", type=float, default=0.25, help="allowed absolute regression, in interpreter starts")
+    parser.add_argument("--update", action="store_true", help="write the baseline instead of checking")
+    parser.add_argument("--profile", nargs="?", type=int, const=25, default=None, help="show N slowest imports")
+    args = parser.parse_args()
+
+    if args.child is not None:
+        return child(args.child)
+    if args.profile is not None:
+        return profile(args.profile)
+
+    results = measure(args.repeat)
+    report(results)
+
+    if args.update:
+        interpreter = results["interpreter_ms"]
+        baseline = {
+            "import_x": round(results["import_ms"] / interpreter, 2),
+            "routes": {route: {"first_response_x": round(data["first_response_ms"] / interpreter, 2)}
+                       for route, data in results["routes"].items()}
+        }
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {os.path.relpath(BASELINE_FILE, ROOT)}")
+        return
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+    failures = check(results, baseline, args.tolerance, args.slack)
+    for failure in failures:
+        print(f"REGRESSION  {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
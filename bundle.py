@@ -0,0 +1,181 @@
+# bundle.py
+from datetime import date, datetime
+from typing import Dict, List
+import hashlib
+import logging
+import struct
+
+from regions import get_region
+from timeutils import format_minutes_as_time, parse_time_to_minutes, schedule_day_dates
+
+logger = logging.getLogger(__name__)
+
+# Binary season bundle format (see decode_season_bundle / README)
+BUNDLE_MAGIC = b"RMDN"
+BUNDLE_VERSION = 1
+BUNDLE_DAYS = 30
+MISSING_TIME = 0  # Reserved time value: no time available for that day
+
+def _write_varint(buf: bytearray, value: int):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            buf.append(byte | 0x80)
+        else:
+            buf.append(byte)
+            return
+
+def _read_varint(data: bytes, pos: int) -> tuple:
+    value, shift = 0, 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+def encode_season_bundle(start_date: str, seasons: List[tuple]) -> bytes:
+    """Encode [(district_id, timezone, days, is_approximate), ...] into a version 1 bundle
+    
+    Every season must have exactly BUNDLE_DAYS days; raises ValueError otherwise
+    or if start_date is not a valid YYYY-MM-DD date.
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    strings: Dict[str, int] = {}
+    
+    def string_index(value: str) -> int:
+        return strings.setdefault(value or "", len(strings))
+    
+    body = bytearray()
+    _write_varint(body, len(seasons))
+    for district_id, tz_name, days, is_approximate in seasons:
+        if len(days) != BUNDLE_DAYS:
+            raise ValueError(f"Season for {district_id} has {len(days)} days, expected {BUNDLE_DAYS}")
+        _write_varint(body, string_index(district_id))
+        _write_varint(body, string_index(tz_name))
+        body.append(1 if is_approximate else 0)
+        for field in ("Suhoor", "Iftaar"):
+            previous = 0
+            for day in days:
+                minutes = parse_time_to_minutes(day.get(field, ""))
+                if minutes is None:
+                    _write_varint(body, MISSING_TIME)
+                    continue
+                _write_varint(body, _zigzag(minutes - previous) + 1)
+                previous = minutes
+        for field in ("islamicDate", "Day"):
+            for day in days:
+                _write_varint(body, string_index(day.get(field, "")))
+    
+    header = bytearray(BUNDLE_MAGIC)
+    header += struct.pack(">BHBBB", BUNDLE_VERSION, start.year, start.month, start.day, BUNDLE_DAYS)
+    _write_varint(header, len(strings))
+    for value in strings:
+        encoded = value.encode("utf-8")
+        _write_varint(header, len(encoded))
+        header += encoded
+    return bytes(header + body)
+
+def decode_season_bundle(data: bytes) -> Dict:
+    """Decode a season bundle back into per-district day lists
+    
+    Layout (all multi-byte integers big-endian, varints are unsigned LEB128):
+      magic "RMDN" | u8 version | u16 year | u8 month | u8 day | u8 day_count
+      varint string_count, then per string: varint byte_length + UTF-8 bytes
+      varint district_count, then per district:
+        varint id (string index) | varint IANA timezone (string index) | u8 flags (bit 0 = approximate)
+        day_count varints: Suhoor minutes since midnight as zigzag(delta) + 1, the delta
+          taken from the previous present day (first from 0); 0 means missing (None)
+        day_count varints: Iftaar minutes, encoded the same way
+        day_count varints: islamicDate string index
+        day_count varints: Day string index
+    """
+    if data[:4] != BUNDLE_MAGIC:
+        raise ValueError("Not a season bundle")
+    version, year, month, day, day_count = struct.unpack_from(">BHBBB", data, 4)
+    if version != BUNDLE_VERSION:
+        raise ValueError(f"Unsupported bundle version: {version}")
+    pos = 10
+    
+    strings = []
+    string_count, pos = _read_varint(data, pos)
+    for _ in range(string_count):
+        length, pos = _read_varint(data, pos)
+        strings.append(data[pos:pos + length].decode("utf-8"))
+        pos += length
+    
+    start_date = date(year, month, day).isoformat()
+    dates = schedule_day_dates(start_date, day_count)
+    districts = {}
+    district_count, pos = _read_varint(data, pos)
+    for _ in range(district_count):
+        id_index, pos = _read_varint(data, pos)
+        tz_index, pos = _read_varint(data, pos)
+        flags = data[pos]
+        pos += 1
+        columns = {}
+        for field in ("Suhoor", "Iftaar"):
+            values, minutes = [], 0
+            for _ in range(day_count):
+                value, pos = _read_varint(data, pos)
+                if value == MISSING_TIME:
+                    values.append(None)
+                    continue
+                minutes += _unzigzag(value - 1)
+                values.append(format_minutes_as_time(minutes))
+            columns[field] = values
+        for field in ("islamicDate", "Day"):
+            values = []
+            for _ in range(day_count):
+                index, pos = _read_varint(data, pos)
+                values.append(strings[index])
+            columns[field] = values
+        districts[strings[id_index]] = {
+            "timezone": strings[tz_index],
+            "is_approximate": bool(flags & 1),
+            "days": [
+                {"date": dates[i], **{field: columns[field][i] for field in columns}}
+                for i in range(day_count)
+            ]
+        }
+    
+    return {"version": version, "start_date": start_date, "districts": districts}
+
+def load_seasons(districts: List[Dict], start_date: str, pack=None) -> List[tuple]:
+    """Return [(district_id, timezone, days, is_approximate), ...] for a full season
+    
+    Upstream schedules are fetched concurrently (see fetch_schedules).
+    Districts without a complete upstream season are padded with
+    approximations and flagged as approximate.
+    """
+    from schedules import calculate_prayer_times_approximation, fetch_schedules
+    pack = pack or get_region()
+    
+    upstream = {}
+    if pack.source == "upstream":
+        results, failed = fetch_schedules([district["id"] for district in districts], start_date, pack=pack)
+        if failed:
+            logger.warning(f"Bundle using approximations for {len(failed)} district(s): {', '.join(failed)}")
+        for district_id, response_data in results.items():
+            upstream[district_id] = response_data.get("Data", {}).get("FastTime", [])
+    
+    seasons = []
+    for district in districts:
+        days = list(upstream.get(district["id"], []))[:BUNDLE_DAYS]
+        is_approximate = pack.source == "upstream" and len(days) < BUNDLE_DAYS
+        for date_str in schedule_day_dates(start_date, BUNDLE_DAYS)[len(days):]:
+            days.append(calculate_prayer_times_approximation(district, date_str, pack))
+        seasons.append((district["id"], str(pack.tz(district)), days, is_approximate))
+    return seasons
+
+def bundle_etag(data: bytes) -> str:
+    """ETag of an encoded bundle"""
+    return hashlib.sha1(data).hexdigest()[:20]
@@ -0,0 +1,41 @@
+# duas.py
+import random
+from typing import Dict
+
+# Collection of Ramadan Duas for API response (optional)
+RAMADAN_DUAS = [
+    {
+        "arabic": "اللَّهُمَّ إِنِّي أَسْأَلُكَ بِرَحْمَتِكَ الَّتِي وَسِعَتْ كُلَّ شَيْءٍ أَنْ تَغْفِرَ لِي",
+        "bangla": "হে আল্লাহ! আপনার রহমতের উসিলায় যা সব কিছুকে পরিব্যাপ্ত করে, আমি আপনার কাছে ক্ষমা প্রার্থনা করছি।",
+        "english": "O Allah, I ask You by Your mercy which encompasses all things, that You forgive me.",
+        "reference": "দোয়া ইফতার"
+    },
+    {
+        "arabic": "اللَّهُمَّ لَكَ صُمْتُ وَعَلَى رِزْقِكَ أَفْطَرْتُ",
+        "bangla": "হে আল্লাহ! আমি আপনার জন্য রোজা রেখেছি এবং আপনার দেওয়া রিযিক দিয়ে ইফতার করছি।",
+        "english": "O Allah, I fasted for You and I break my fast with Your provision.",
+        "reference": "আবু দাউদ"
+    },
+    {
+        "arabic": "ذَهَبَ الظَّمَأُ وَابْتَلَّتِ الْعُرُوقُ وَثَبَتَ الأَجْرُ إِنْ شَاءَ اللَّهُ",
+        "bangla": "পিপাসা চলে গেল, শিরা-উপশিরা সিক্ত হল এবং সওয়াব স্থির হল, ইনশাআল্লাহ।",
+        "english": "Thirst has gone, the veins are moist, and the reward is confirmed, if Allah wills.",
+        "reference": "আবু দাউদ"
+    },
+    {
+        "arabic": "اللَّهُمَّ إِنِّي أَسْأَلُكَ الْجَنَّةَ وَمَا قَرَّبَ إِلَيْهَا مِنْ قَوْلٍ أَوْ عَمَلٍ",
+        "bangla": "হে আল্লাহ! আমি আপনার কাছে জান্নাত প্রার্থনা করছি এবং সেই সকল কথা ও কাজ যা জান্নাতের নিকটবর্তী করে।",
+        "english": "O Allah, I ask You for Paradise and for words and deeds that bring me closer to it.",
+        "reference": "তিরমিজি"
+    },
+    {
+        "arabic": "رَبَّنَا آتِنَا فِي الدُّنْيَا حَسَنَةً وَفِي الْآخِرَةِ حَسَنَةً وَقِنَا عَذَابَ النَّارِ",
+        "bangla": "হে আমাদের রব! আমাদের দুনিয়াতে কল্যাণ দিন এবং আখিরাতেও কল্যাণ দিন এবং আমাদের জাহান্নামের শাস্তি থেকে রক্ষা করুন।",
+        "english": "Our Lord! Give us in this world good, and in the Hereafter good, and save us from the punishment of the Fire.",
+        "reference": "সূরা বাকারা, ২:২০১"
+    }
+]
+
+def random_dua() -> Dict:
+    """Pick a random Ramadan Dua"""
+    return random.choice(RAMADAN_DUAS)
@@ -0,0 +1,140 @@
+# regions/__init__.py
+import importlib
+import sys
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+DEFAULT_REGION = "bd"
+
+# Packs idle longer than this are dropped so their tables can be freed;
+# idle packs are looked for at most once per REGION_SWEEP_SECONDS
+REGION_IDLE_SECONDS = 3600
+REGION_SWEEP_SECONDS = 60
+
+# Available packs; modules are only imported on first use
+REGION_REGISTRY = {
+    "bd": {"module": "regions.bangladesh", "name_en": "Bangladesh"},
+    "uk": {"module": "regions.united_kingdom", "name_en": "United Kingdom"},
+    "us": {"module": "regions.united_states", "name_en": "United States"},
+}
+
+
+class RegionPack:
+    """Location table, timezone, schedule source and defaults for one region"""
+
+    def __init__(self, region_id: str, name: str, name_en: str, timezone: str,
+                 locations: List[Dict], source: str, default_location: str,
+                 language: str = "en", default_suhoor: str = "5:00 AM",
+                 default_iftar: str = "6:00 PM", fajr_angle: float = 18.0,
+                 upstream_url: Optional[str] = None,
+                 upstream_headers: Optional[Dict] = None):
+        self.region_id = region_id
+        self.name = name
+        self.name_en = name_en
+        self.timezone = timezone
+        self.locations = locations
+        self.source = source  # "upstream" or "solar"
+        self.default_location = default_location
+        self.language = language
+        self.default_suhoor = default_suhoor
+        self.default_iftar = default_iftar
+        self.fajr_angle = fajr_angle
+        self.upstream_url = upstream_url
+        self.upstream_headers = upstream_headers or {}
+        self._by_id = {location["id"]: location for location in locations}
+        self._zones: Dict[str, ZoneInfo] = {}
+
+    def get_location(self, location_id: str) -> Optional[Dict]:
+        """Get location information by ID"""
+        return self._by_id.get(location_id)
+
+    def validate_location(self, location_id: str) -> str:
+        """Validate and return location ID, falling back to the pack default"""
+        location_id = (location_id or "").lower().strip()
+        if location_id in self._by_id:
+            return location_id
+        return self.default_location
+
+    def tz(self, location: Optional[Dict] = None) -> ZoneInfo:
+        """Timezone of a location (locations may override the pack timezone)"""
+        name = (location or {}).get("tz", self.timezone)
+        if name not in self._zones:
+            self._zones[name] = ZoneInfo(name)
+        return self._zones[name]
+
+    def now(self, location: Optional[Dict] = None) -> datetime:
+        """Current aware datetime in the location's timezone"""
+        return datetime.now(self.tz(location))
+
+    def today(self, location: Optional[Dict] = None) -> date:
+        """Today's date in the location's timezone"""
+        return self.now(location).date()
+
+    def summary(self) -> Dict:
+        return {
+            "id": self.region_id,
+            "name": self.name,
+            "name_en": self.name_en,
+            "timezone": self.timezone,
+            "source": self.source,
+            "default_location": self.default_location,
+            "locations_count": len(self.locations)
+        }
+
+
+_lock = threading.Lock()
+_active: Dict[str, RegionPack] = {}
+_last_used: Dict[str, float] = {}
+_last_sweep = 0.0
+
+
+def _evict_idle(now: float):
+    """Drop idle packs and every reference the import system holds to their modules"""
+    global _last_sweep
+    _last_sweep = now
+    for region_id in list(_active):
+        if region_id == DEFAULT_REGION or now - _last_used[region_id] < REGION_IDLE_SECONDS:
+            continue
+        del _active[region_id]
+        del _last_used[region_id]
+        module_name = REGION_REGISTRY[region_id]["module"]
+        sys.modules.pop(module_name, None)
+        # import_module also binds the submodule as an attribute of this package
+        parent, _, child = module_name.rpartition(".")
+        if parent == __name__ and child in globals():
+            del globals()[child]
+
+
+def get_region(region_id: Optional[str] = None) -> RegionPack:
+    """Return a region pack, importing it on first use; unknown ids fall back to the default"""
+    region_id = (region_id or DEFAULT_REGION).lower().strip()
+    if region_id not in REGION_REGISTRY:
+        region_id = DEFAULT_REGION
+
+    pack = _active.get(region_id)
+    if pack is not None and region_id == DEFAULT_REGION:
+        # Hot path: the default pack is pinned; other packs still age out
+        if len(_active) > 1 and time.monotonic() - _last_sweep >= REGION_SWEEP_SECONDS:
+            with _lock:
+                _evict_idle(time.monotonic())
+        return pack
+
+    with _lock:
+        now = time.monotonic()
+        if region_id not in _active:
+            module = importlib.import_module(REGION_REGISTRY[region_id]["module"])
+            _active[region_id] = module.PACK
+        _last_used[region_id] = now
+        _evict_idle(now)
+        return _active[region_id]
+
+
+def list_regions() -> List[Dict]:
+    """Registered regions, without loading their packs"""
+    return [
+        {"id": region_id, "name_en": info["name_en"], "loaded": region_id in _active}
+        for region_id, info in REGION_REGISTRY.items()
+    ]
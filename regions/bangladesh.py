@@ -0,0 +1,102 @@
+# regions/bangladesh.py
+from regions import RegionPack
+
+# Schedule source: Islamic Foundation times via deenislamic
+BASE_URL = "https://services.deenislamic.com/api/SeheriIftarTime"
+HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "accept-language": "en-US",
+    "client": "3",
+    "content-type": "application/json",
+    "Referer": "https://deenislamic.com/"
+}
+
+# All 64 districts of Bangladesh with coordinates
+LOCATIONS = [
+    {"id": "dhaka", "name": "ঢাকা", "name_en": "Dhaka", "lat": 23.8103, "lon": 90.4125, "division": "ঢাকা"},
+    {"id": "faridpur", "name": "ফরিদপুর", "name_en": "Faridpur", "lat": 23.6071, "lon": 89.8422, "division": "ঢাকা"},
+    {"id": "gazipur", "name": "গাজীপুর", "name_en": "Gazipur", "lat": 23.9999, "lon": 90.4203, "division": "ঢাকা"},
+    {"id": "gopalganj", "name": "গোপালগঞ্জ", "name_en": "Gopalganj", "lat": 23.0055, "lon": 89.8268, "division": "ঢাকা"},
+    {"id": "kishoreganj", "name": "কিশোরগঞ্জ", "name_en": "Kishoreganj", "lat": 24.4447, "lon": 90.7761, "division": "ঢাকা"},
+    {"id": "madaripur", "name": "মাদারীপুর", "name_en": "Madaripur", "lat": 23.1645, "lon": 90.1896, "division": "ঢাকা"},
+    {"id": "manikganj", "name": "মানিকগঞ্জ", "name_en": "Manikganj", "lat": 23.8644, "lon": 90.0008, "division": "ঢাকা"},
+    {"id": "munshiganj", "name": "মুন্সিগঞ্জ", "name_en": "Munshiganj", "lat": 23.5422, "lon": 90.5301, "division": "ঢাকা"},
+    {"id": "narayanganj", "name": "নারায়ণগঞ্জ", "name_en": "Narayanganj", "lat": 23.6213, "lon": 90.4954, "division": "ঢাকা"},
+    {"id": "narsingdi", "name": "নরসিংদী", "name_en": "Narsingdi", "lat": 23.9206, "lon": 90.7177, "division": "ঢাকা"},
+    {"id": "rajbari", "name": "রাজবাড়ী", "name_en": "Rajbari", "lat": 23.7575, "lon": 89.6426, "division": "ঢাকা"},
+    {"id": "shariatpur", "name": "শরীয়তপুর", "name_en": "Shariatpur", "lat": 23.2423, "lon": 90.3500, "division": "ঢাকা"},
+    {"id": "tangail", "name": "টাঙ্গাইল", "name_en": "Tangail", "lat": 24.2513, "lon": 89.9167, "division": "ঢাকা"},
+    
+    {"id": "chittagong", "name": "চট্টগ্রাম", "name_en": "Chittagong", "lat": 22.3569, "lon": 91.7832, "division": "চট্টগ্রাম"},
+    {"id": "bandarban", "name": "বান্দরবান", "name_en": "Bandarban", "lat": 22.1953, "lon": 92.2183, "division": "চট্টগ্রাম"},
+    {"id": "brahmanbaria", "name": "ব্রাহ্মণবাড়িয়া", "name_en": "Brahmanbaria", "lat": 23.9608, "lon": 91.1115, "division": "চট্টগ্রাম"},
+    {"id": "chandpur", "name": "চাঁদপুর", "name_en": "Chandpur", "lat": 23.2336, "lon": 90.6636, "division": "চট্টগ্রাম"},
+    {"id": "comilla", "name": "কুমিল্লা", "name_en": "Comilla", "lat": 23.4683, "lon": 91.1787, "division": "চট্টগ্রাম"},
+    {"id": "cox_bazar", "name": "কক্সবাজার", "name_en": "Cox's Bazar", "lat": 21.4272, "lon": 92.0058, "division": "চট্টগ্রাম"},
+    {"id": "feni", "name": "ফেনী", "name_en": "Feni", "lat": 23.0158, "lon": 91.3975, "division": "চট্টগ্রাম"},
+    {"id": "khagrachhari", "name": "খাগড়াছড়ি", "name_en": "Khagrachhari", "lat": 23.1071, "lon": 91.9697, "division": "চট্টগ্রাম"},
+    {"id": "lakshmipur", "name": "লক্ষ্মীপুর", "name_en": "Lakshmipur", "lat": 22.9447, "lon": 90.8284, "division": "চট্টগ্রাম"},
+    {"id": "noakhali", "name": "নোয়াখালী", "name_en": "Noakhali", "lat": 22.8696, "lon": 91.0997, "division": "চট্টগ্রাম"},
+    {"id": "rangamati", "name": "রাঙ্গামাটি", "name_en": "Rangamati", "lat": 22.7324, "lon": 92.2985, "division": "চট্টগ্রাম"},
+    
+    {"id": "rajshahi", "name": "রাজশাহী", "name_en": "Rajshahi", "lat": 24.3636, "lon": 88.6241, "division": "রাজশাহী"},
+    {"id": "bogra", "name": "বগুড়া", "name_en": "Bogra", "lat": 24.8465, "lon": 89.3772, "division": "রাজশাহী"},
+    {"id": "joypurhat", "name": "জয়পুরহাট", "name_en": "Joypurhat", "lat": 25.0968, "lon": 89.0401, "division": "রাজশাহী"},
+    {"id": "naogaon", "name": "নওগাঁ", "name_en": "Naogaon", "lat": 24.8091, "lon": 88.9445, "division": "রাজশাহী"},
+    {"id": "natore", "name": "নাটোর", "name_en": "Natore", "lat": 24.4129, "lon": 89.0010, "division": "রাজশাহী"},
+    {"id": "chapainawabganj", "name": "চাঁপাইনবাবগঞ্জ", "name_en": "Chapainawabganj", "lat": 24.5965, "lon": 88.2774, "division": "রাজশাহী"},
+    {"id": "pabna", "name": "পাবনা", "name_en": "Pabna", "lat": 24.0064, "lon": 89.2372, "division": "রাজশাহী"},
+    {"id": "sirajganj", "name": "সিরাজগঞ্জ", "name_en": "Sirajganj", "lat": 24.4535, "lon": 89.6167, "division": "রাজশাহী"},
+    
+    {"id": "khulna", "name": "খুলনা", "name_en": "Khulna", "lat": 22.8456, "lon": 89.5403, "division": "খুলনা"},
+    {"id": "bagerhat", "name": "বাগেরহাট", "name_en": "Bagerhat", "lat": 22.6602, "lon": 89.7895, "division": "খুলনা"},
+    {"id": "chuadanga", "name": "চুয়াডাঙ্গা", "name_en": "Chuadanga", "lat": 23.6401, "lon": 88.8557, "division": "খুলনা"},
+    {"id": "jashore", "name": "যশোর", "name_en": "Jashore", "lat": 23.1749, "lon": 89.2038, "division": "খুলনা"},
+    {"id": "jhenaidah", "name": "ঝিনাইদহ", "name_en": "Jhenaidah", "lat": 23.5528, "lon": 89.1573, "division": "খুলনা"},
+    {"id": "kushtia", "name": "কুষ্টিয়া", "name_en": "Kushtia", "lat": 23.9017, "lon": 89.1212, "division": "খুলনা"},
+    {"id": "magura", "name": "মাগুরা", "name_en": "Magura", "lat": 23.4873, "lon": 89.4199, "division": "খুলনা"},
+    {"id": "meherpur", "name": "মেহেরপুর", "name_en": "Meherpur", "lat": 23.7792, "lon": 88.6473, "division": "খুলনা"},
+    {"id": "narail", "name": "নড়াইল", "name_en": "Narail", "lat": 23.1639, "lon": 89.5041, "division": "খুলনা"},
+    {"id": "shatkhira", "name": "সাতক্ষীরা", "name_en": "Satkhira", "lat": 22.7185, "lon": 89.0705, "division": "খুলনা"},
+    
+    {"id": "barisal", "name": "বরিশাল", "name_en": "Barisal", "lat": 22.7010, "lon": 90.3535, "division": "বরিশাল"},
+    {"id": "barguna", "name": "বরগুনা", "name_en": "Barguna", "lat": 22.1591, "lon": 90.1241, "division": "বরিশাল"},
+    {"id": "bhola", "name": "ভোলা", "name_en": "Bhola", "lat": 22.6884, "lon": 90.6485, "division": "বরিশাল"},
+    {"id": "jhalokati", "name": "ঝালকাঠি", "name_en": "Jhalokati", "lat": 22.6425, "lon": 90.2002, "division": "বরিশাল"},
+    {"id": "patuakhali", "name": "পটুয়াখালী", "name_en": "Patuakhali", "lat": 22.3596, "lon": 90.3290, "division": "বরিশাল"},
+    {"id": "pirojpur", "name": "পিরোজপুর", "name_en": "Pirojpur", "lat": 22.5841, "lon": 89.9720, "division": "বরিশাল"},
+    
+    {"id": "sylhet", "name": "সিলেট", "name_en": "Sylhet", "lat": 24.8949, "lon": 91.8687, "division": "সিলেট"},
+    {"id": "habiganj", "name": "হবিগঞ্জ", "name_en": "Habiganj", "lat": 24.3749, "lon": 91.4156, "division": "সিলেট"},
+    {"id": "moulvibazar", "name": "মৌলভীবাজার", "name_en": "Moulvibazar", "lat": 24.4820, "lon": 91.7774, "division": "সিলেট"},
+    {"id": "sunamganj", "name": "সুনামগঞ্জ", "name_en": "Sunamganj", "lat": 25.0715, "lon": 91.3992, "division": "সিলেট"},
+    
+    {"id": "rangpur", "name": "রংপুর", "name_en": "Rangpur", "lat": 25.7439, "lon": 89.2752, "division": "রংপুর"},
+    {"id": "dinajpur", "name": "দিনাজপুর", "name_en": "Dinajpur", "lat": 25.6279, "lon": 88.6332, "division": "রংপুর"},
+    {"id": "gaibandha", "name": "গাইবান্ধা", "name_en": "Gaibandha", "lat": 25.3295, "lon": 89.5425, "division": "রংপুর"},
+    {"id": "kurigram", "name": "কুড়িগ্রাম", "name_en": "Kurigram", "lat": 25.8072, "lon": 89.6296, "division": "রংপুর"},
+    {"id": "lalmonirhat", "name": "লালমনিরহাট", "name_en": "Lalmonirhat", "lat": 25.9172, "lon": 89.4459, "division": "রংপুর"},
+    {"id": "nilphamari", "name": "নীলফামারী", "name_en": "Nilphamari", "lat": 25.9312, "lon": 88.8565, "division": "রংপুর"},
+    {"id": "panchagarh", "name": "পঞ্চগড়", "name_en": "Panchagarh", "lat": 26.3411, "lon": 88.5545, "division": "রংপুর"},
+    {"id": "thakurgaon", "name": "ঠাকুরগাঁও", "name_en": "Thakurgaon", "lat": 26.0336, "lon": 88.4676, "division": "রংপুর"},
+    
+    {"id": "mymensingh", "name": "ময়মনসিংহ", "name_en": "Mymensingh", "lat": 24.7471, "lon": 90.4203, "division": "ময়মনসিংহ"},
+    {"id": "jamalpur", "name": "জামালপুর", "name_en": "Jamalpur", "lat": 24.9375, "lon": 89.9372, "division": "ময়মনসিংহ"},
+    {"id": "netrokona", "name": "নেত্রকোণা", "name_en": "Netrokona", "lat": 24.8831, "lon": 90.7275, "division": "ময়মনসিংহ"},
+    {"id": "sherpur", "name": "শেরপুর", "name_en": "Sherpur", "lat": 25.0205, "lon": 90.0175, "division": "ময়মনসিংহ"}
+]
+
+PACK = RegionPack(
+    region_id="bd",
+    name="বাংলাদেশ",
+    name_en="Bangladesh",
+    timezone="Asia/Dhaka",
+    locations=LOCATIONS,
+    source="upstream",
+    default_location="dhaka",
+    language="bn",
+    default_suhoor="5:11 AM",
+    default_iftar="5:58 PM",
+    upstream_url=BASE_URL,
+    upstream_headers=HEADERS
+)
@@ -0,0 +1,76 @@
+# regions/solar.py
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+import math
+
+from regions import RegionPack
+from timeutils import format_minutes_as_time
+
+SUNSET_ANGLE = 0.833  # Refraction plus solar radius
+
+HIJRI_MONTHS = [
+    "Muharram", "Safar", "Rabi al-Awwal", "Rabi al-Thani", "Jumada al-Awwal", "Jumada al-Thani",
+    "Rajab", "Shaban", "Ramadan", "Shawwal", "Dhu al-Qadah", "Dhu al-Hijjah"
+]
+
+
+def _sun_event(lat: float, lon: float, day: date, utc_offset_min: float,
+               angle: float, rising: bool) -> Optional[float]:
+    """Local minutes since midnight when the sun is `angle` degrees below the horizon (NOAA)"""
+    gamma = 2 * math.pi / 365 * (day.timetuple().tm_yday - 1)
+    eqtime = 229.18 * (0.000075 + 0.001868 * math.cos(gamma) - 0.032077 * math.sin(gamma)
+                       - 0.014615 * math.cos(2 * gamma) - 0.040849 * math.sin(2 * gamma))
+    decl = (0.006918 - 0.399912 * math.cos(gamma) + 0.070257 * math.sin(gamma)
+            - 0.006758 * math.cos(2 * gamma) + 0.000907 * math.sin(2 * gamma)
+            - 0.002697 * math.cos(3 * gamma) + 0.00148 * math.sin(3 * gamma))
+    lat_rad = math.radians(lat)
+    cos_ha = (math.cos(math.radians(90 + angle)) / (math.cos(lat_rad) * math.cos(decl))
+              - math.tan(lat_rad) * math.tan(decl))
+    if abs(cos_ha) > 1:
+        return None  # Sun never reaches this angle on this day
+    ha = math.degrees(math.acos(cos_ha))
+    utc_minutes = 720 - 4 * (lon + ha if rising else lon - ha) - eqtime
+    return utc_minutes + utc_offset_min
+
+
+def solar_times(lat: float, lon: float, day: date, tz, fajr_angle: float = 18.0) -> Tuple[int, int]:
+    """(suhoor, iftar) in local minutes since midnight: Fajr and sunset"""
+    offset = datetime(day.year, day.month, day.day, 12, tzinfo=tz).utcoffset().total_seconds() / 60
+    sunrise = _sun_event(lat, lon, day, offset, SUNSET_ANGLE, rising=True)
+    sunset = _sun_event(lat, lon, day, offset, SUNSET_ANGLE, rising=False)
+    fajr = _sun_event(lat, lon, day, offset, fajr_angle, rising=True)
+    if fajr is None:
+        # High latitudes: one-seventh of the night before sunrise
+        fajr = sunrise - (24 * 60 - (sunset - sunrise)) / 7
+    return int(fajr), int(math.ceil(sunset))
+
+
+def _hijri_to_jd(year: int, month: int, day: int) -> float:
+    return (day + math.ceil(29.5 * (month - 1)) + (year - 1) * 354
+            + math.floor((3 + 11 * year) / 30) + 1948439.5 - 1)
+
+
+def hijri_date(day: date) -> Tuple[int, int, int]:
+    """Tabular (arithmetical) Hijri date; may differ by a day from local sighting"""
+    jd = day.toordinal() + 1721425.5
+    year = math.floor((30 * (jd - 1948439.5) + 10646) / 10631)
+    month = min(12, math.ceil((jd - (29 + _hijri_to_jd(year, 1, 1))) / 29.5) + 1)
+    return year, month, int(jd - _hijri_to_jd(year, month, 1) + 1)
+
+
+def solar_day(pack: RegionPack, location: Dict, date_str: str) -> Dict:
+    """A calendar row in the upstream FastTime shape, computed locally"""
+    day = datetime.strptime(date_str, "%Y-%m-%d").date()
+    suhoor, iftar = solar_times(location["lat"], location["lon"], day, pack.tz(location), pack.fajr_angle)
+    h_year, h_month, h_day = hijri_date(day)
+    return {
+        "Date": day.strftime("%d %b"),
+        "islamicDate": f"{h_day} {HIJRI_MONTHS[h_month - 1]}, {h_year} AH",
+        "Day": day.strftime("%A"),
+        "Day_en": day.strftime("%A"),
+        "Suhoor": format_minutes_as_time(suhoor),
+        "Iftaar": format_minutes_as_time(iftar),
+        "isToday": day == pack.today(location),
+        "seheri": format_minutes_as_time(suhoor),
+        "iftar": format_minutes_as_time(iftar)
+    }
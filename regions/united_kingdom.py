@@ -0,0 +1,30 @@
+# regions/united_kingdom.py
+from regions import RegionPack
+
+# Cities with large Bangladeshi communities
+LOCATIONS = [
+    {"id": "london", "name": "London", "name_en": "London", "lat": 51.5074, "lon": -0.1278, "division": "England"},
+    {"id": "birmingham", "name": "Birmingham", "name_en": "Birmingham", "lat": 52.4862, "lon": -1.8904, "division": "England"},
+    {"id": "manchester", "name": "Manchester", "name_en": "Manchester", "lat": 53.4808, "lon": -2.2426, "division": "England"},
+    {"id": "oldham", "name": "Oldham", "name_en": "Oldham", "lat": 53.5409, "lon": -2.1114, "division": "England"},
+    {"id": "bradford", "name": "Bradford", "name_en": "Bradford", "lat": 53.7960, "lon": -1.7594, "division": "England"},
+    {"id": "luton", "name": "Luton", "name_en": "Luton", "lat": 51.8787, "lon": -0.4200, "division": "England"},
+    {"id": "leeds", "name": "Leeds", "name_en": "Leeds", "lat": 53.8008, "lon": -1.5491, "division": "England"},
+    {"id": "cardiff", "name": "Cardiff", "name_en": "Cardiff", "lat": 51.4816, "lon": -3.1791, "division": "Wales"},
+    {"id": "glasgow", "name": "Glasgow", "name_en": "Glasgow", "lat": 55.8642, "lon": -4.2518, "division": "Scotland"},
+    {"id": "edinburgh", "name": "Edinburgh", "name_en": "Edinburgh", "lat": 55.9533, "lon": -3.1883, "division": "Scotland"},
+    {"id": "belfast", "name": "Belfast", "name_en": "Belfast", "lat": 54.5973, "lon": -5.9301, "division": "Northern Ireland"}
+]
+
+PACK = RegionPack(
+    region_id="uk",
+    name="United Kingdom",
+    name_en="United Kingdom",
+    timezone="Europe/London",
+    locations=LOCATIONS,
+    source="solar",
+    default_location="london",
+    default_suhoor="5:15 AM",
+    default_iftar="5:30 PM",
+    fajr_angle=18.0  # Muslim World League
+)
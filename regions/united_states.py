@@ -0,0 +1,31 @@
+# regions/united_states.py
+from regions import RegionPack
+
+# Cities with large Bangladeshi communities; tz overrides the pack timezone
+LOCATIONS = [
+    {"id": "new-york", "name": "New York", "name_en": "New York", "lat": 40.7128, "lon": -74.0060, "division": "New York", "tz": "America/New_York"},
+    {"id": "buffalo", "name": "Buffalo", "name_en": "Buffalo", "lat": 42.8864, "lon": -78.8784, "division": "New York", "tz": "America/New_York"},
+    {"id": "paterson", "name": "Paterson", "name_en": "Paterson", "lat": 40.9168, "lon": -74.1718, "division": "New Jersey", "tz": "America/New_York"},
+    {"id": "philadelphia", "name": "Philadelphia", "name_en": "Philadelphia", "lat": 39.9526, "lon": -75.1652, "division": "Pennsylvania", "tz": "America/New_York"},
+    {"id": "washington", "name": "Washington", "name_en": "Washington", "lat": 38.9072, "lon": -77.0369, "division": "District of Columbia", "tz": "America/New_York"},
+    {"id": "atlanta", "name": "Atlanta", "name_en": "Atlanta", "lat": 33.7490, "lon": -84.3880, "division": "Georgia", "tz": "America/New_York"},
+    {"id": "detroit", "name": "Detroit", "name_en": "Detroit", "lat": 42.3314, "lon": -83.0458, "division": "Michigan", "tz": "America/Detroit"},
+    {"id": "hamtramck", "name": "Hamtramck", "name_en": "Hamtramck", "lat": 42.3928, "lon": -83.0496, "division": "Michigan", "tz": "America/Detroit"},
+    {"id": "chicago", "name": "Chicago", "name_en": "Chicago", "lat": 41.8781, "lon": -87.6298, "division": "Illinois", "tz": "America/Chicago"},
+    {"id": "houston", "name": "Houston", "name_en": "Houston", "lat": 29.7604, "lon": -95.3698, "division": "Texas", "tz": "America/Chicago"},
+    {"id": "dallas", "name": "Dallas", "name_en": "Dallas", "lat": 32.7767, "lon": -96.7970, "division": "Texas", "tz": "America/Chicago"},
+    {"id": "los-angeles", "name": "Los Angeles", "name_en": "Los Angeles", "lat": 34.0522, "lon": -118.2437, "division": "California", "tz": "America/Los_Angeles"}
+]
+
+PACK = RegionPack(
+    region_id="us",
+    name="United States",
+    name_en="United States",
+    timezone="America/New_York",
+    locations=LOCATIONS,
+    source="solar",
+    default_location="new-york",
+    default_suhoor="5:30 AM",
+    default_iftar="6:30 PM",
+    fajr_angle=15.0  # ISNA
+)
@@ -0,0 +1,310 @@
+# schedules.py
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from collections import deque
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from regions import DEFAULT_REGION, get_region
+from timeutils import schedule_day_dates
+
+logger = logging.getLogger(__name__)
+
+# Set RAMADAN_OFFLINE=1 to skip the upstream API and serve approximations
+OFFLINE = os.environ.get("RAMADAN_OFFLINE") == "1"
+
+# Cache configuration (1 hour TTL) - Note: This will reset per invocation on Vercel
+_cache = None
+
+# Concurrent upstream fetching (bundles, refresh): workers and overall deadline (seconds)
+SCHEDULE_FETCH_WORKERS = 8
+SCHEDULE_FETCH_DEADLINE = 8
+
+# Upstream payloads are revalidated after this many seconds but kept past it, so
+# unchanged days keep their fingerprints and ETags and an upstream outage serves
+# the last known schedule instead of an approximation
+SCHEDULE_REVALIDATE_SECONDS = 3600
+_schedule_store = None
+# Guards the store and change tracking; bundles fetch schedules from worker threads
+_store_lock = threading.RLock()
+
+# Change tracking for upstream schedule revisions
+# Fingerprints of each normalized FastTime day, keyed by (region_id, district_id, YYYY-MM-DD).
+# Bounded like the schedule store (one 30-day window per stored payload), since
+# clients choose start_date; a fingerprint evicted here is simply re-learned.
+SCHEDULE_STORE_SIZE = 500
+_day_fingerprints = None
+# Feed of per-day change events so downstream caches can purge precisely.
+# Sequence numbers are only meaningful within INSTANCE_ID (one process).
+schedule_events = deque(maxlen=1000)
+event_sequence = itertools.count(1)
+INSTANCE_ID = uuid.uuid4().hex[:12]
+
+def get_cache():
+    """Shared TTL cache for derived data (bundles), created on first use"""
+    global _cache
+    if _cache is None:
+        from cachetools import TTLCache
+        _cache = TTLCache(maxsize=200, ttl=3600)
+    return _cache
+
+def get_schedule_store():
+    """Last known upstream payloads as (fetched_at, payload), created on first use"""
+    global _schedule_store
+    with _store_lock:
+        if _schedule_store is None:
+            from cachetools import LRUCache
+            _schedule_store = LRUCache(maxsize=SCHEDULE_STORE_SIZE)
+    return _schedule_store
+
+def get_day_fingerprints():
+    """Day fingerprints (see above), created on first use"""
+    global _day_fingerprints
+    with _store_lock:
+        if _day_fingerprints is None:
+            from cachetools import LRUCache
+            _day_fingerprints = LRUCache(maxsize=SCHEDULE_STORE_SIZE * 30)
+    return _day_fingerprints
+
+def normalize_schedule_day(day: Dict) -> Dict:
+    """Strip fields that change without an upstream revision (e.g. isToday)"""
+    return {k: v for k, v in day.items() if k != "isToday"}
+
+def fingerprint_value(value) -> str:
+    """Stable fingerprint of a JSON-serializable value"""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+def fingerprint_day(day: Dict) -> str:
+    """Stable fingerprint of a normalized FastTime day"""
+    return fingerprint_value(normalize_schedule_day(day))
+
+def invalidate_schedule_day(district_id: str, day_date: str, keep_key: Optional[str] = None,
+                            region_id: str = DEFAULT_REGION):
+    """Drop stored payloads and bundles of a district whose 30-day window covers day_date"""
+    targets = [
+        (get_schedule_store(), "schedule_", (f"_{region_id}_{district_id}",)),
+        (get_cache(), "bundle_", (f"_{region_id}_{district_id}", f"_{region_id}_all"))
+    ]
+    for store, prefix, suffixes in targets:
+        for key in list(store.keys()):
+            if key == keep_key or not key.startswith(prefix) or not key.endswith(suffixes):
+                continue
+            start_date = key[len(prefix):len(prefix) + 10]
+            try:
+                covered = schedule_day_dates(start_date, 30)
+            except ValueError:
+                continue
+            if day_date in covered:
+                store.pop(key, None)
+
+def record_schedule_changes(district_id: str, start_date: str, response_data: Dict, cache_key_str: str,
+                            region_id: str = DEFAULT_REGION, today: Optional[str] = None) -> List[Dict]:
+    """Diff an upstream payload against stored fingerprints and emit change events
+    
+    Rows carry no machine-readable date, so row i is taken to be start_date + i.
+    The row upstream marks isToday must then sit at today's position; if it
+    does not, the payload is not aligned with start_date and is not diffed.
+    """
+    days = response_data.get("Data", {}).get("FastTime", [])
+    day_dates = schedule_day_dates(start_date, len(days))
+    marked = [day_date for day_date, day in zip(day_dates, days) if day.get("isToday")]
+    if today and marked and marked != [today]:
+        logger.warning(f"Schedule for {district_id} from {start_date} is not aligned "
+                       f"(isToday at {marked[0]}, expected {today}); skipping change tracking")
+        return []
+    day_fingerprints = get_day_fingerprints()
+    events = []
+    for day_date, day in zip(day_dates, days):
+        key = (region_id, district_id, day_date)
+        fingerprint = fingerprint_day(day)
+        previous = day_fingerprints.get(key)
+        if previous == fingerprint:
+            continue
+        day_fingerprints[key] = fingerprint
+        if previous is None:
+            continue  # First sighting, nothing downstream to purge
+        invalidate_schedule_day(district_id, day_date, keep_key=cache_key_str, region_id=region_id)
+        event = {
+            "seq": next(event_sequence),
+            "region": region_id,
+            "district": district_id,
+            "date": day_date,
+            "fingerprint": fingerprint,
+            "previous_fingerprint": previous,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+        schedule_events.append(event)
+        events.append(event)
+        logger.info(f"Schedule changed for {district_id} on {day_date}")
+    return events
+
+def fetch_schedule(district_id: str, start_date: str, force: bool = False, pack=None) -> Dict:
+    """Fetch a 30-day schedule from the region's upstream API
+    
+    Stored payloads younger than SCHEDULE_REVALIDATE_SECONDS are served as is.
+    Older ones are revalidated against upstream: unchanged days keep their
+    fingerprints, changed days are invalidated, and if upstream fails the stored
+    payload is served. force=True always refetches and raises on failure.
+    """
+    pack = pack or get_region()
+    store = get_schedule_store()
+    cache_key_str = f"schedule_{start_date}_{pack.region_id}_{district_id}"
+    with _store_lock:
+        entry = store.get(cache_key_str)
+    if entry and not force and time.monotonic() - entry[0] < SCHEDULE_REVALIDATE_SECONDS:
+        return entry[1]
+    
+    try:
+        # Imported before the offline check so benchmarks still pay for it
+        import requests
+        if OFFLINE:
+            raise RuntimeError("Upstream API disabled (RAMADAN_OFFLINE=1)")
+        response = requests.post(
+            f"{pack.upstream_url}/RamadanSeheriIftarTime",
+            json={
+                "firstDate": start_date,
+                "location": district_id,
+                "language": pack.language
+            },
+            headers=pack.upstream_headers,
+            timeout=10
+        )
+        response.raise_for_status()
+        response_data = response.json()
+    except Exception as e:
+        if entry and not force:
+            logger.warning(f"Revalidation failed for {district_id}, serving stored schedule: {str(e)}")
+            return entry[1]
+        raise
+    with _store_lock:
+        store[cache_key_str] = (time.monotonic(), response_data)
+        today = pack.today(pack.get_location(district_id)).isoformat()
+        record_schedule_changes(district_id, start_date, response_data, cache_key_str, pack.region_id, today)
+    return response_data
+
+def fetch_schedules(district_ids: List[str], start_date: str, force: bool = False, pack=None,
+                    fail_fast: bool = True) -> tuple:
+    """Fetch schedules concurrently within SCHEDULE_FETCH_DEADLINE seconds
+    
+    Returns ({district_id: payload}, [failed district_id, ...]). Fetches still
+    running at the deadline count as failed. With fail_fast, no new fetches
+    are started after the first failure.
+    """
+    from concurrent.futures import ALL_COMPLETED, FIRST_EXCEPTION, ThreadPoolExecutor, wait
+    pack = pack or get_region()
+    deadline = time.monotonic() + SCHEDULE_FETCH_DEADLINE
+    executor = ThreadPoolExecutor(max_workers=SCHEDULE_FETCH_WORKERS)
+    futures = {
+        executor.submit(fetch_schedule, district_id, start_date, force, pack): district_id
+        for district_id in district_ids
+    }
+    done, pending = wait(futures, timeout=SCHEDULE_FETCH_DEADLINE,
+                         return_when=FIRST_EXCEPTION if fail_fast else ALL_COMPLETED)
+    if pending and any(future.exception() for future in done):
+        # Upstream is failing: don't start the rest, let in-flight requests finish
+        running = [future for future in pending if not future.cancel()]
+        wait(running, timeout=max(0, deadline - time.monotonic()))
+    executor.shutdown(wait=False, cancel_futures=True)
+    
+    results, failed = {}, []
+    for future, district_id in futures.items():
+        if not future.done() or future.cancelled():
+            logger.warning(f"Schedule fetch for {district_id} skipped or timed out")
+            failed.append(district_id)
+        elif future.exception():
+            logger.warning(f"Schedule fetch failed for {district_id}: {str(future.exception())}")
+            failed.append(district_id)
+        else:
+            results[district_id] = future.result()
+    return results, failed
+
+def schedule_etag(region_id: str, district_id: str, start_date: str, count: int, today: str,
+                  extra: Optional[Dict] = None) -> str:
+    """ETag derived from the day fingerprints, re-versioned only when a day changes
+    
+    `extra` is any other upstream data the response carries (e.g. FastTracker);
+    its fingerprint is part of the ETag too.
+    """
+    parts = [region_id, district_id, start_date, today]
+    if extra is not None:
+        parts.append(fingerprint_value(extra))
+    day_fingerprints = get_day_fingerprints()
+    with _store_lock:
+        for day_date in schedule_day_dates(start_date, count):
+            parts.append(day_fingerprints.get((region_id, district_id, day_date), "-"))
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:20]
+
+def calculate_prayer_times_approximation(district: Dict, date_str: str, pack=None) -> Dict:
+    """Calculate approximate prayer times based on coordinates"""
+    pack = pack or get_region()
+    if pack.source == "solar":
+        from regions.solar import solar_day
+        return solar_day(pack, district, date_str)
+    lat = district["lat"]
+    
+    # Base times for the default location (approximate)
+    base_fajr = pack.default_suhoor
+    base_maghrib = pack.default_iftar
+    
+    # Adjust based on latitude (simplified)
+    lat_diff = lat - pack.get_location(pack.default_location)["lat"]  # Difference from default location latitude
+    time_adjustment = lat_diff * 0.5  # Rough adjustment in minutes
+    
+    def adjust_time(time_str: str, minutes: float) -> str:
+        try:
+            time_part, period = time_str.split(' ')
+            hour, minute = map(int, time_part.split(':'))
+            
+            total_minutes = hour * 60 + minute + minutes
+            if period == "PM" and hour != 12:
+                total_minutes += 12 * 60
+            elif period == "AM" and hour == 12:
+                total_minutes -= 12 * 60
+            
+            total_minutes = total_minutes % (24 * 60)
+            
+            new_hour = int(total_minutes // 60) % 12
+            if new_hour == 0:
+                new_hour = 12
+            new_minute = int(total_minutes % 60)
+            new_period = "AM" if total_minutes < 12 * 60 else "PM"
+            
+            return f"{new_hour}:{new_minute:02d} {new_period}"
+        except:
+            return time_str
+    
+    # Parse date to get day of week
+    try:
+        day_date = datetime.strptime(date_str, "%Y-%m-%d")
+        day_name_bn = ['শনিবার', 'রবিবার', 'সোমবার', 'মঙ্গলবার', 'বুধবার', 'বৃহস্পতিবার', 'শুক্রবার'][day_date.weekday()]
+        day_name_en = day_date.strftime("%A")
+    except:
+        day_name_bn = "শুক্রবার"
+        day_name_en = "Friday"
+    
+    # Calculate Hijri date (approximate)
+    try:
+        # This is a very rough approximation - in production use proper Hijri conversion
+        hijri_date = f"{int(date_str[8:10])} রমজান, ১৪৪৬ হিজরী"
+    except:
+        hijri_date = "২ রমজান, ১৪৪৬ হিজরী"
+    
+    return {
+        "Date": date_str[5:10].replace('-', ' '),
+        "islamicDate": hijri_date,
+        "banglaDate": f"{int(date_str[8:10])} ফাল্গুন, ১৪৩২",
+        "Day": day_name_bn,
+        "Day_en": day_name_en,
+        "Suhoor": adjust_time(base_fajr, -time_adjustment),
+        "Iftaar": adjust_time(base_maghrib, time_adjustment * 0.4),
+        "isToday": (date_str == pack.today(district).isoformat()),
+        "seheri": adjust_time(base_fajr, -time_adjustment),
+        "iftar": adjust_time(base_maghrib, time_adjustment * 0.4)
+    }
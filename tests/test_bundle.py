@@ -0,0 +1,66 @@
+# tests/test_bundle.py
+import pytest
+
+from app import app
+from bundle import BUNDLE_DAYS, decode_season_bundle, encode_season_bundle
+from timeutils import format_minutes_as_time, schedule_day_dates
+
+
+def make_days(suhoor_minutes, iftar_minutes):
+    days = []
+    for i in range(BUNDLE_DAYS):
+        days.append({
+            "Suhoor": format_minutes_as_time(suhoor_minutes - i // 3),
+            "Iftaar": format_minutes_as_time(iftar_minutes + i // 4),
+            "islamicDate": f"{i + 1} রমজান, ১৪৪৭ হিজরী",
+            "Day": ["শনিবার", "রবিবার", "সোমবার"][i % 3]
+        })
+    return days
+
+
+def test_round_trip():
+    seasons = [
+        ("dhaka", "Asia/Dhaka", make_days(5 * 60 + 11, 17 * 60 + 58), False),
+        ("chicago", "America/Chicago", make_days(5 * 60 + 4, 17 * 60 + 52), True),
+    ]
+    decoded = decode_season_bundle(encode_season_bundle("2026-02-18", seasons))
+
+    assert decoded["version"] == 1
+    assert decoded["start_date"] == "2026-02-18"
+    assert list(decoded["districts"]) == ["dhaka", "chicago"]
+    dates = schedule_day_dates("2026-02-18", BUNDLE_DAYS)
+    for district_id, tz_name, days, is_approximate in seasons:
+        district = decoded["districts"][district_id]
+        assert district["timezone"] == tz_name
+        assert district["is_approximate"] is is_approximate
+        for i, day in enumerate(district["days"]):
+            assert day == {"date": dates[i], **days[i]}
+
+
+def test_missing_times_are_not_invented():
+    days = make_days(5 * 60 + 11, 17 * 60 + 58)
+    days[0]["Suhoor"] = ""
+    days[7]["Iftaar"] = "n/a"
+    decoded = decode_season_bundle(encode_season_bundle("2026-02-18", [("dhaka", "Asia/Dhaka", days, False)]))
+
+    decoded_days = decoded["districts"]["dhaka"]["days"]
+    assert decoded_days[0]["Suhoor"] is None
+    assert decoded_days[1]["Suhoor"] == days[1]["Suhoor"]
+    assert decoded_days[7]["Iftaar"] is None
+    assert decoded_days[8]["Iftaar"] == days[8]["Iftaar"]
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        decode_season_bundle(b"not a bundle")
+
+
+def test_rejects_wrong_day_count():
+    days = make_days(5 * 60 + 11, 17 * 60 + 58)[:-1]
+    with pytest.raises(ValueError):
+        encode_season_bundle("2026-02-18", [("dhaka", "Asia/Dhaka", days, False)])
+
+
+def test_bundle_route_rejects_invalid_start_date():
+    response = app.test_client().get("/api/ramadan/bundle/dhaka?start_date=2026-13-40")
+    assert response.status_code == 400
@@ -0,0 +1,41 @@
+# tests/test_regions.py
+from datetime import datetime
+import sys
+
+import regions
+from app import app
+from regions import DEFAULT_REGION, REGION_IDLE_SECONDS, get_region
+from timeutils import parse_time_to_minutes
+
+
+def test_idle_pack_is_evicted_and_default_kept(monkeypatch):
+    get_region(DEFAULT_REGION)
+    get_region("uk")
+    assert "regions.united_kingdom" in sys.modules
+
+    # Age every pack past the idle limit and make the next call sweep
+    for region_id in regions._last_used:
+        regions._last_used[region_id] -= REGION_IDLE_SECONDS + 1
+    monkeypatch.setattr(regions, "_last_sweep", float("-inf"))
+    get_region(DEFAULT_REGION)
+
+    assert "uk" not in regions._active
+    assert "regions.united_kingdom" not in sys.modules
+    assert not hasattr(regions, "united_kingdom")
+    assert DEFAULT_REGION in regions._active
+    assert get_region("uk").region_id == "uk"
+
+
+def test_countdown_across_dst_change(monkeypatch):
+    pack = get_region("us")
+    district = pack.get_location("new-york")
+    # 1:00 AM EST on the night clocks go forward to EDT
+    now = datetime(2026, 3, 8, 1, 0, tzinfo=pack.tz(district))
+    monkeypatch.setattr(pack, "now", lambda location=None: now)
+
+    response = app.test_client().get("/api/ramadan/countdown/new-york?region=us")
+    data = response.json
+    assert data["date"] == "2026-03-08"
+    assert data["timezone"] == "America/New_York"
+    wall_clock_seconds = (parse_time_to_minutes(data["iftar_time"]) - 60) * 60
+    assert data["countdown"]["total_seconds"] == wall_clock_seconds - 3600
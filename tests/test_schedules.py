@@ -0,0 +1,131 @@
+# tests/test_schedules.py
+from collections import deque
+import itertools
+
+import pytest
+import requests
+
+import schedules
+from app import app
+from timeutils import schedule_day_dates
+
+
+class FakeUpstream:
+    """Stands in for requests.post: 30 FastTime rows from firstDate, revisable per day"""
+
+    def __init__(self):
+        self.revisions = {}
+        self.fast_tracker = {"remaining": 10}
+
+    def __call__(self, url, json=None, **kwargs):
+        rows = [
+            {
+                "Suhoor": "5:11 AM",
+                "Iftaar": self.revisions.get((json["location"], day_date), "5:58 PM"),
+                "Date": day_date[5:],
+                "isToday": False
+            }
+            for day_date in schedule_day_dates(json["firstDate"], 30)
+        ]
+        return FakeResponse({"Data": {"FastTime": rows, "FastTracker": dict(self.fast_tracker)}})
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    monkeypatch.setattr(schedules, "OFFLINE", False)
+    monkeypatch.setattr(schedules, "_cache", None)
+    monkeypatch.setattr(schedules, "_schedule_store", None)
+    monkeypatch.setattr(schedules, "_day_fingerprints", None)
+    monkeypatch.setattr(schedules, "schedule_events", deque(maxlen=1000))
+    monkeypatch.setattr(schedules, "event_sequence", itertools.count(1))
+    fake = FakeUpstream()
+    monkeypatch.setattr(requests, "post", fake)
+    return fake
+
+
+def revise(upstream, district_id, day_date, start_date="2026-02-18"):
+    upstream.revisions[(district_id, day_date)] = "6:01 PM"
+    schedules.fetch_schedule(district_id, start_date, force=True)
+
+
+def test_revision_invalidates_only_covering_windows(upstream):
+    client = app.test_client()
+    for start_date in ("2026-02-01", "2026-02-18", "2026-03-10"):
+        schedules.fetch_schedule("dhaka", start_date)
+    schedules.fetch_schedule("khulna", "2026-02-01")
+    assert client.get("/api/ramadan/bundle/dhaka?start_date=2026-02-18").status_code == 200
+    assert client.get("/api/ramadan/bundle/khulna?start_date=2026-02-18").status_code == 200
+
+    revise(upstream, "dhaka", "2026-02-20")
+
+    assert set(schedules.get_schedule_store()) == {
+        "schedule_2026-02-18_bd_dhaka",  # The refetched window itself
+        "schedule_2026-03-10_bd_dhaka",  # Does not cover 2026-02-20
+        "schedule_2026-02-18_bd_khulna",
+        "schedule_2026-02-01_bd_khulna",
+    }
+    assert set(schedules.get_cache()) == {"bundle_2026-02-18_bd_khulna"}
+
+
+def test_calendar_etag_changes_with_revision(upstream):
+    client = app.test_client()
+    url = "/api/ramadan/calendar/dhaka?start_date=2026-02-18"
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    schedules.fetch_schedule("dhaka", "2026-02-18", force=True)
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    revise(upstream, "dhaka", "2026-03-01")
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json["calendar"][11]["Iftaar"] == "6:01 PM"
+
+
+def test_today_etag_changes_with_fast_tracker(upstream):
+    client = app.test_client()
+    etag = client.get("/api/ramadan/today/dhaka").headers["ETag"]
+
+    upstream.fast_tracker = {"remaining": 9}
+    schedules.fetch_schedule("dhaka", schedules.get_region().today().isoformat(), force=True)
+    response = client.get("/api/ramadan/today/dhaka", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json["fast_tracker"] == {"remaining": 9}
+
+
+def test_changes_feed_reset_and_truncated(upstream, monkeypatch):
+    client = app.test_client()
+    schedules.fetch_schedule("dhaka", "2026-02-18")
+    revise(upstream, "dhaka", "2026-02-20")
+
+    feed = client.get("/api/ramadan/changes?since=0").json
+    assert feed["count"] == 1
+    assert feed["changes"][0]["date"] == "2026-02-20"
+    assert not feed["reset"] and not feed["truncated"]
+    instance, last_seq = feed["instance"], feed["last_seq"]
+
+    # Another instance's sequence numbers, or a cursor ahead of this feed, mean start over
+    feed = client.get(f"/api/ramadan/changes?since={last_seq}&instance=elsewhere").json
+    assert feed["reset"] and feed["since"] == 0 and feed["count"] == 1
+    assert client.get(f"/api/ramadan/changes?since={last_seq + 5}&instance={instance}").json["reset"]
+
+    # Events the consumer has not seen were dropped from the feed
+    monkeypatch.setattr(schedules, "schedule_events", deque(schedules.schedule_events, maxlen=2))
+    revise(upstream, "dhaka", "2026-02-21")
+    revise(upstream, "dhaka", "2026-02-22")
+    feed = client.get(f"/api/ramadan/changes?since={last_seq - 1}&instance={instance}").json
+    assert feed["truncated"] and not feed["reset"]
+    feed = client.get(f"/api/ramadan/changes?since={last_seq}&instance={instance}").json
+    assert not feed["truncated"] and feed["count"] == 2
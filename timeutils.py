@@ -0,0 +1,28 @@
+# timeutils.py
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+def parse_time_to_minutes(time_str: str) -> Optional[int]:
+    """Parse a time like '5:58 PM' into minutes since midnight"""
+    try:
+        time_str = time_str.strip().upper()
+        period = "PM" if "PM" in time_str else "AM" if "AM" in time_str else None
+        hour, minute = map(int, time_str.replace("AM", "").replace("PM", "").strip().split(":")[:2])
+        if period == "PM" and hour != 12:
+            hour += 12
+        elif period == "AM" and hour == 12:
+            hour = 0
+        return hour * 60 + minute
+    except (AttributeError, ValueError):
+        return None
+
+def format_minutes_as_time(minutes: int) -> str:
+    """Format minutes since midnight as 'H:MM AM/PM'"""
+    hour, minute = divmod(minutes % (24 * 60), 60)
+    period = "AM" if hour < 12 else "PM"
+    return f"{hour % 12 or 12}:{minute:02d} {period}"
+
+def schedule_day_dates(start_date: str, count: int) -> List[str]:
+    """Dates (YYYY-MM-DD) covered by a FastTime list starting at start_date"""
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(count)]